@@ -12,9 +12,21 @@
     >>> random_movie = client.get_random_movie()
 """
 
+import functools
+
 import requests
+from requests.adapters import HTTPAdapter
 from settings import settings
 
+# orjson разбирает JSON в 2-3 раза быстрее стандартной библиотеки;
+# при его отсутствии используется stdlib. Оба варианта принимают
+# байты напрямую, поэтому ответы парсятся из response.content без
+# промежуточной строки и определения кодировки внутри .json()
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 
 class KinopoiskAPIClient:
     """Клиент для работы с API Кинопоиска версии 1.4.
@@ -25,6 +37,7 @@ class KinopoiskAPIClient:
 
     Особенности:
         - Автоматическая авторизация по API-ключу
+        - Переиспользование TCP-соединений через requests.Session
         - Встроенная обработка HTTP-ошибок
         - Поддержка пагинации при поиске
         - Возвращает данные в формате JSON
@@ -38,6 +51,10 @@ class KinopoiskAPIClient:
             'https://api.kinopoisk.dev/v1.4/movie')
             - API-ключ для авторизации запросов
 
+        Создает requests.Session с пулом соединений, чтобы
+        последовательные запросы переиспользовали одно
+        TCP/TLS-соединение вместо открытия нового на каждый вызов.
+
         Пример:
             >>> client = KinopoiskAPIClient()
             >>> print(client.base_url)
@@ -46,8 +63,35 @@ class KinopoiskAPIClient:
         self.base_url = settings.API_URL
         self.headers = {
             "accept": "application/json",
+            # Явно запрашиваем сжатие: requests прозрачно распаковывает
+            # ответ, а по сети передается в разы меньше байт. Только
+            # кодеки, которые urllib3 умеет без дополнительных
+            # пакетов: предложить br без установленного brotli значит
+            # получить нераспакованное тело и ошибку разбора JSON
+            "Accept-Encoding": "gzip, deflate",
             "X-API-KEY": settings.API_KEY
         }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=10)
+        )
+        # Сырые байты последнего ответа search_movies: позволяют
+        # прикладывать ответ к отчету без повторной сериализации
+        self.last_response_content: bytes | None = None
+
+    def close(self) -> None:
+        """Закрывает сессию и освобождает пул соединений."""
+        self.session.close()
+
+    def __enter__(self) -> "KinopoiskAPIClient":
+        """Позволяет использовать клиент как контекстный менеджер."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Закрывает сессию при выходе из контекстного менеджера."""
+        self.close()
 
     def search_movies(
         self,
@@ -72,23 +116,48 @@ class KinopoiskAPIClient:
                 "movies": [{...}, {...}]    # Список фильмов
             }
 
+        Особенности:
+            Ответы кэшируются по ключу (query, page, limit):
+            повторный идентичный запрос в рамках одного прогона
+            не обращается к сети. Ошибки не кэшируются.
+
         Исключения:
             requests.HTTPError: Если API возвращает ошибку (4xx или 5xx)
             requests.RequestException: При проблемах с сетью
         """
+        raw = self._search_movies_raw(query, page, self._clamp(limit))
+        self.last_response_content = raw
+        return loads(raw)
+
+    @staticmethod
+    def _clamp(limit: int) -> int:
+        """Ограничивает limit максимумом API (50 результатов)."""
+        return limit if limit < 50 else 50
+
+    @functools.lru_cache(maxsize=256)
+    def _search_movies_raw(
+        self,
+        query: str,
+        page: int,
+        limit: int
+    ) -> bytes:
+        """Выполняет сетевой запрос поиска (с кэшированием ответа).
+
+        Кэшируются сырые байты ответа, а не разобранный словарь:
+        search_movies разбирает их заново на каждый вызов, поэтому
+        вызывающий код всегда получает свежий словарь и его мутации
+        не портят кэш. raise_for_status срабатывает до возврата
+        значения, поэтому в кэш попадают только успешные ответы.
+        """
         url = f"{self.base_url}/search"
         params = {
             "query": query,
             "page": page,
-            "limit": min(limit, 50)  # API ограничивает максимум 50
+            "limit": limit
         }
-        response = requests.get(
-            url,
-            headers=self.headers,
-            params=params
-        )
+        response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return response.content
 
     def get_random_movie(self) -> dict[str, int | str | list] | None:
         """Получает один случайный фильм из базы Кинопоиска.
@@ -108,9 +177,9 @@ class KinopoiskAPIClient:
         """
         url = f"{self.base_url}/random"
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             response.raise_for_status()
-            return response.json()
+            return loads(response.content)
         except requests.RequestException as e:
             print(f"Ошибка при получении фильма: {e}")
             return None
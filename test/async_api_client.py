@@ -0,0 +1,224 @@
+"""
+Модуль асинхронного взаимодействия с API Кинопоиска.
+
+Асинхронный аналог KinopoiskAPIClient на основе aiohttp. Позволяет
+выполнять несколько поисковых запросов (или запросов разных страниц)
+параллельно в одном цикле событий: N сетевых вызовов перекрываются
+и занимают примерно время одного round-trip вместо N последовательных.
+
+Пример использования:
+    >>> import asyncio
+    >>> async def main():
+    ...     async with AsyncKinopoiskAPIClient() as client:
+    ...         return await client.search_many(
+    ...             ["Гарри Поттер", "Интерстеллар"]
+    ...         )
+    >>> results = asyncio.run(main())
+"""
+
+import asyncio
+import os
+
+import aiohttp
+from settings import settings
+
+# Тот же быстрый парсер JSON (с фолбэком), что и в api_client
+from api_client import loads
+
+
+class AsyncKinopoiskAPIClient:
+    """Асинхронный клиент для работы с API Кинопоиска версии 1.4.
+
+    Держит одну aiohttp.ClientSession на всё время жизни клиента,
+    поэтому соединения переиспользуются так же, как в синхронном
+    клиенте. Предназначен для сценариев, где нужно выполнить
+    несколько запросов одновременно (пагинация, пакетный поиск).
+
+    Особенности:
+        - Автоматическая авторизация по API-ключу
+        - Параллельное выполнение запросов через asyncio.gather
+        - Возвращает данные в формате JSON (словарь/список)
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует клиент настройками из конфигурации.
+
+        Сессия aiohttp создается лениво при первом запросе, так как
+        ClientSession должна создаваться внутри работающего цикла
+        событий.
+        """
+        self.base_url = settings.API_URL
+        self.headers = {
+            "accept": "application/json",
+            "X-API-KEY": settings.API_KEY
+        }
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Возвращает сессию aiohttp, создавая её при первом вызове."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers=self.headers)
+        return self._session
+
+    async def close(self) -> None:
+        """Закрывает сессию aiohttp и освобождает соединения."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncKinopoiskAPIClient":
+        """Позволяет использовать клиент как async-контекст."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Закрывает сессию при выходе из async-контекста."""
+        await self.close()
+
+    async def search_movies(
+        self,
+        query: str,
+        page: int = 1,
+        limit: int = 10
+    ) -> dict[str, int | list]:
+        """Ищет фильмы по названию (асинхронная версия).
+
+        Отправляет GET-запрос к /search endpoint API Кинопоиска.
+
+        Аргументы:
+            query: Строка для поиска (например, "Гарри Поттер")
+            page: Номер страницы результатов (начинается с 1)
+            limit: Максимальное количество результатов на странице (1-50)
+
+        Возвращает:
+            Словарь с результатами поиска (как в KinopoiskAPIClient).
+
+        Исключения:
+            aiohttp.ClientResponseError: Если API возвращает ошибку
+            aiohttp.ClientError: При проблемах с сетью
+        """
+        url = f"{self.base_url}/search"
+        params = {
+            "query": query,
+            "page": page,
+            "limit": min(limit, 50)  # API ограничивает максимум 50
+        }
+        session = self._get_session()
+        async with session.get(
+            url, params=params, raise_for_status=True
+        ) as response:
+            return await response.json(loads=loads)
+
+    async def search_many(
+        self,
+        queries: list[str]
+    ) -> list[dict[str, int | list]]:
+        """Выполняет несколько поисковых запросов параллельно.
+
+        Все запросы отправляются одновременно через asyncio.gather,
+        поэтому суммарное время близко к времени одного запроса.
+
+        Аргументы:
+            queries: Список поисковых строк
+
+        Возвращает:
+            Список ответов API в том же порядке, что и запросы.
+        """
+        return await asyncio.gather(
+            *[self.search_movies(query) for query in queries]
+        )
+
+
+class BatchedClient:
+    """Пакетный клиент поиска с ограниченным числом запросов в полете.
+
+    Чистый asyncio.gather по всем запросам может превысить лимит
+    конкурентности API (и получить 429). BatchedClient складывает
+    поступающие запросы в очередь и обрабатывает их небольшими
+    пакетами под семафором, сохраняя выигрыш от параллелизма, но
+    ограничивая число одновременных соединений.
+
+    Параметры настраиваются переменными окружения:
+        KP_BATCH_K: Максимум одновременных запросов (по умолчанию 4)
+        KP_BATCH_B: Размер пакета, снимаемого из очереди за раз
+            (по умолчанию 8)
+
+    Пример использования:
+        >>> async def main():
+        ...     async with BatchedClient() as client:
+        ...         return await client.search("Гарри Поттер")
+    """
+
+    def __init__(
+        self,
+        client: AsyncKinopoiskAPIClient | None = None,
+        concurrency: int | None = None,
+        batch_size: int | None = None
+    ) -> None:
+        """Инициализирует пакетный клиент.
+
+        Аргументы:
+            client: Готовый асинхронный клиент (по умолчанию
+                создается новый AsyncKinopoiskAPIClient)
+            concurrency: Максимум одновременных запросов;
+                перекрывает KP_BATCH_K
+            batch_size: Размер пакета; перекрывает KP_BATCH_B
+        """
+        self.client = client or AsyncKinopoiskAPIClient()
+        self._concurrency = concurrency or int(
+            os.environ.get("KP_BATCH_K", "4")
+        )
+        self._batch_size = batch_size or int(
+            os.environ.get("KP_BATCH_B", "8")
+        )
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+        self._worker: asyncio.Task | None = None
+
+    async def search(self, query: str) -> dict[str, int | list]:
+        """Ставит запрос в очередь и ждет его результата.
+
+        Аргументы:
+            query: Строка для поиска
+
+        Возвращает:
+            Ответ API для данного запроса (как search_movies).
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((query, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        """Снимает запросы из очереди пакетами и выполняет их."""
+        while not self._queue.empty():
+            batch = []
+            while (
+                len(batch) < self._batch_size
+                and not self._queue.empty()
+            ):
+                batch.append(self._queue.get_nowait())
+            await asyncio.gather(
+                *[self._run_one(query, future) for query, future in batch]
+            )
+
+    async def _run_one(self, query: str, future: asyncio.Future) -> None:
+        """Выполняет один запрос под семафором и заполняет future."""
+        async with self._semaphore:
+            try:
+                result = await self.client.search_movies(query)
+            except Exception as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Закрывает нижележащий клиент."""
+        await self.client.close()
+
+    async def __aenter__(self) -> "BatchedClient":
+        """Позволяет использовать клиент как async-контекст."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Закрывает клиент при выходе из async-контекста."""
+        await self.close()
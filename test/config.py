@@ -24,6 +24,9 @@ class Config:
         BASE_URL (str): Базовый URL тестируемого сайта.
         SEARCH_TIMEOUT (int): Таймаут ожидания для операций поиска (в секундах)
         ELEMENT_TIMEOUT (int): Таймаут ожидания элементов UI (в секундах).
+        PAGE_TIMEOUT (int): Таймаут полной загрузки страницы (в секундах).
+        FAST_TIMEOUT (int): Таймаут быстрых элементов на уже
+            загруженной странице (в секундах).
         TEST_DATA (dict): Словарь с тестовыми данными для различных сценариев.
     """
 
@@ -33,6 +36,11 @@ class Config:
     # Таймауты ожидания (в секундах)
     SEARCH_TIMEOUT = 15  # Для операций поиска
     ELEMENT_TIMEOUT = 15  # Для ожидания элементов UI
+    PAGE_TIMEOUT = ELEMENT_TIMEOUT  # Для полной загрузки страницы
+    # Для элементов, появляющихся на уже загруженной странице
+    # (автоподсказки, поле ввода): долгий таймаут здесь только
+    # растягивал время падающих проверок
+    FAST_TIMEOUT = 2
 
     # Тестовые данные
     TEST_DATA = {
@@ -4,33 +4,72 @@
 Содержит фикстуры для управления браузером в автоматизированных тестах.
 """
 
+import contextlib
+import os
+import tempfile
+
+import allure
 import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 
+from config import Config
 
-@pytest.fixture(scope="function")
-def browser():
+
+def pytest_configure(config):
+    """Отключает Allure-обвязку, когда отчет не собирается.
+
+    Без --alluredir шаги и вложения никуда не пишутся, но контекстные
+    менеджеры allure.step и скриншоты в allure.attach все равно
+    выполняются на каждый вызов. Замена их на no-op убирает эти
+    накладные расходы в локальных прогонах; при запуске с --alluredir
+    поведение не меняется.
     """
-    Фикстура для инициализации и управления браузером Chrome в тестах.
+    if config.getoption("--alluredir", default=None):
+        return
 
-    Эта фикстура выполняет следующие действия:
-    - Создает экземпляр браузера Chrome с настройками анти-детекта
-    - Максимизирует окно браузера перед началом теста
-    - Автоматически устанавливает совместимую версию ChromeDriver
-    - Гарантирует закрытие браузера после завершения теста
+    allure.step = lambda title: contextlib.nullcontext()
+    allure.attach = lambda *args, **kwargs: None
 
-    Scope: function - создается новый браузер для каждого теста
 
-    Yields:
-        WebDriver: Объект драйвера Selenium WebDriver для управления браузером
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Снимает скриншот браузера один раз при падении теста.
 
-    Example:
-        def test_example(browser):
-            browser.get("https://example.com")
-            assert "Example" in browser.title
+    PNG-кодирование страницы — самая тяжелая операция Chrome в
+    smoke-прогоне, поэтому скриншот делается централизованно и только
+    на упавших тестах, вместо inline allure.attach в каждом
+    except-блоке (до трех кодирований на одно падение). Без
+    --alluredir вложение все равно некуда писать, поэтому и сам
+    снимок не делается.
+    """
+    outcome = yield
+    rep = outcome.get_result()
+    if (
+        rep.when == "call"
+        and rep.failed
+        and "browser" in item.fixturenames
+        and item.config.getoption("--alluredir", default=None)
+    ):
+        browser = item.funcargs.get("browser")
+        if browser is None:
+            return
+        try:
+            allure.attach(
+                browser.get_screenshot_as_png(),
+                name=f"failure_{item.name}",
+                attachment_type=allure.attachment_type.PNG
+            )
+        except Exception:
+            pass
+
+
+def _build_options() -> Options:
+    """Собирает объект настроек Chrome (вызывается один раз на модуль).
+
+    Returns:
+        Options: Настройки Chrome с анти-детектом и отключенными
+        уведомлениями/сохранением паролей.
     """
     chrome_options = Options()
 
@@ -75,29 +114,48 @@ def browser():
         "safebrowsing.enabled": True
     })
 
-    # Инициализация драйвера
-    driver = webdriver.Chrome(
-        service=ChromeService(ChromeDriverManager().install()),
-        options=chrome_options
+    return chrome_options
+
+
+# Настройки Chrome собираются один раз при импорте модуля
+# и переиспользуются всеми запусками фикстуры
+_CHROME_OPTIONS = _build_options()
+
+
+@pytest.fixture(scope="session")
+def browser():
+    """
+    Фикстура для инициализации и управления браузером Chrome в тестах.
+
+    Эта фикстура выполняет следующие действия:
+    - Создает экземпляр браузера Chrome с настройками анти-детекта
+    - Максимизирует окно браузера перед началом теста
+    - Совместимый ChromeDriver подбирает встроенный Selenium Manager
+    - Гарантирует закрытие браузера после завершения сессии
+
+    Scope: session - один браузер на весь прогон; холодный старт
+    Chrome (~2-4 с) оплачивается один раз, а не на каждый тест.
+    Очистка состояния между тестами выполняется фикстурой
+    reset_browser. Настройки берутся из готового _CHROME_OPTIONS.
+
+    Yields:
+        WebDriver: Объект драйвера Selenium WebDriver для управления браузером
+
+    Example:
+        def test_example(browser):
+            browser.get("https://example.com")
+            assert "Example" in browser.title
+    """
+    # При запуске с pytest-xdist у каждого воркера свой профиль
+    # Chrome, иначе параллельные браузеры конфликтуют за user-data-dir
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    _CHROME_OPTIONS.add_argument(
+        f"--user-data-dir={tempfile.gettempdir()}/chrome-profile-{worker}"
     )
 
-    # JavaScript-инъекция для скрытия автоматизации
-    scripts = [
-        "Object.defineProperty(navigator, 'webdriver',{get: () => undefined})",
-        "window.navigator.chrome = {runtime: {}, app: {},};",
-        "Object.defineProperty(navigator, 'languages', "
-        "{get: () => ['ru-RU', 'ru', 'en-US', 'en']});",
-        "Object.defineProperty(navigator, 'plugins', "
-        "{get: () => [1, 2, 3, 4, 5]});",
-        "Object.defineProperty(navigator, 'hardwareConcurrency', "
-        "{get: () => 8});"
-    ]
-
-    for script in scripts:
-        try:
-            driver.execute_script(script)
-        except Exception:
-            continue
+    # Инициализация драйвера: Selenium Manager (Selenium >= 4.6)
+    # сам подбирает совместимый ChromeDriver без webdriver-manager
+    driver = webdriver.Chrome(options=_CHROME_OPTIONS)
 
     # CDP команды для обхода детекции
     driver.execute_cdp_cmd("Network.setUserAgentOverride", {
@@ -106,14 +164,25 @@ def browser():
         "Chrome/120.0.0.0 Safari/537.36"
     })
 
+    # Все JS-инъекции для скрытия автоматизации объединены в один
+    # скрипт, регистрируемый единственной CDP-командой: вместо пяти
+    # последовательных execute_script патчи применяются автоматически
+    # при каждой навигации (а не только на стартовой странице)
     driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
         "source": """
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
             });
+            window.navigator.chrome = {runtime: {}, app: {},};
             Object.defineProperty(navigator, 'languages', {
                 get: () => ['ru-RU', 'ru', 'en-US', 'en']
             });
+            Object.defineProperty(navigator, 'plugins', {
+                get: () => [1, 2, 3, 4, 5]
+            });
+            Object.defineProperty(navigator, 'hardwareConcurrency', {
+                get: () => 8
+            });
         """
     })
 
@@ -121,27 +190,87 @@ def browser():
     driver.quit()
 
 
+@pytest.fixture(scope="class")
+def kinopoisk_home(browser):
+    """Однократная загрузка главной страницы на класс тестов.
+
+    Каждый UI-тест поиска начинал с browser.get(BASE_URL) — полная
+    сетевая загрузка и рендер главной на каждый тест. Фикстура грузит
+    главную один раз на класс; тесты лишь сбрасывают поле поиска
+    (см. _reset_search в test_ui) и возвращаются на главную только
+    если ушли с нее.
+
+    Yields:
+        WebDriver: Драйвер с открытой главной страницей Кинопоиска.
+    """
+    browser.get(Config.BASE_URL)
+    yield browser
+
+
+@pytest.fixture(autouse=True)
+def reset_browser(request):
+    """
+    Фикстура очистки состояния браузера между тестами.
+
+    Так как браузер теперь живет всю сессию, перед каждым тестом,
+    использующим фикстуру browser, сбрасываются cookies. Текущая
+    страница намеренно не трогается: навигация на about:blank
+    обнуляла бы загруженную главную и вынуждала каждый тест заново
+    оплачивать полную загрузку страницы (см. kinopoisk_home). Тесты
+    без браузера (например, API-тесты) не затрагиваются и Chrome
+    не запускают.
+    """
+    if "browser" in request.fixturenames:
+        driver = request.getfixturevalue("browser")
+        driver.delete_all_cookies()
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        # Web-хранилища тоже накапливают состояние между тестами;
+        # на служебных страницах (about:blank и т.п.) доступ к ним
+        # запрещен — такие случаи просто пропускаются
+        try:
+            driver.execute_script(
+                "window.localStorage.clear();"
+                "window.sessionStorage.clear();"
+            )
+        except Exception:
+            pass
+    yield
+
+
 @pytest.fixture(scope="function")
-def browser_with_delay():
+def browser_with_delay(browser):
     """
-    Фикстура браузера с добавлением случайных задержек между действиями.
+    Фикстура браузера с имитацией человеческого поведения.
 
-    Для имитации человеческого поведения.
+    Вместо безусловной блокирующей паузы 2-5 секунд перед каждым
+    переходом используется короткий джиттер (0.1-0.4 с), включаемый
+    переменной окружения KP_HUMAN_DELAY. Экспоненциальная пауза с
+    джиттером применяется только при повторе неудавшегося перехода.
     """
     import random
     import time
 
-    driver = browser()
+    from selenium.common.exceptions import WebDriverException
 
-    # Переопределяем методы для добавления задержек
+    driver = browser
     original_get = driver.get
 
     def delayed_get(url):
-        # Случайная задержка перед переходом
-        time.sleep(random.uniform(2.0, 5.0))
+        # Короткая задержка только при включенной имитации
+        if os.environ.get("KP_HUMAN_DELAY"):
+            time.sleep(random.uniform(0.1, 0.4))
+
+        # Экспоненциальный backoff с джиттером только на повторах
+        for attempt in range(2):
+            try:
+                return original_get(url)
+            except WebDriverException:
+                time.sleep(
+                    min(2 ** attempt * 0.25, 2.0) + random.random() * 0.1
+                )
         return original_get(url)
 
     driver.get = delayed_get
 
     yield driver
-    driver.quit()
+    driver.get = original_get
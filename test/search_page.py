@@ -21,11 +21,25 @@
 - Assertion результаты проверок
 """
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
+from waits import fast_wait
 from selenium.webdriver.support import expected_conditions as EC
 from config import Config
 
+# Локаторы страницы поиска (собраны один раз на уровне модуля)
+_SEARCH_INPUT = (By.NAME, "kp_query")
+_RESULT_NAME = (
+    By.CSS_SELECTOR,
+    "div.search_results > div > div.info > p.name > a"
+)
+_ALTERNATIVE_NAME = (
+    By.CSS_SELECTOR,
+    "div.search_results > div > div.info > p.alternativeName, "
+    "span.alternativeName, "
+    "[class*='alternativeName']"
+)
+
 
 class SearchPage:
     """Page Object класс для страницы поиска фильмов."""
@@ -63,10 +77,10 @@ class SearchPage:
             TimeoutException:
             Если поисковая строка не найдена в течение таймаута
         """
-        search_input = WebDriverWait(
+        search_input = fast_wait(
             self.browser, Config.ELEMENT_TIMEOUT
         ).until(
-            EC.presence_of_element_located((By.NAME, "kp_query"))
+            EC.presence_of_element_located(_SEARCH_INPUT)
         )
         search_input.clear()
         search_input.send_keys(query)
@@ -81,6 +95,10 @@ class SearchPage:
         - Для русских названий: проверяет основной заголовок
         - Для английских названий: проверяет альтернативные названия
 
+        Проверка русского названия выполняется внутри браузера одним
+        вызовом execute_script: через WebDriver передается только
+        булев результат, без сериализации текста заголовка.
+
         Args:
             expected_text (str): Ожидаемый текст в результатах поиска
             is_english (bool, optional): Флаг для английских названий.
@@ -91,28 +109,35 @@ class SearchPage:
 
         Raises:
             AssertionError: Если ожидаемый текст не найден в результатах
-            TimeoutException: Если элементы не найдены в течение таймаута
         """
         if is_english:
             self._verify_english_result(expected_text)
         else:
-            result = WebDriverWait(
-                self.browser, Config.ELEMENT_TIMEOUT
-            ).until(
-                EC.presence_of_element_located((
-                    By.CSS_SELECTOR,
-                    "div.search_results > div > div.info > p.name > a"
-                ))
-            )
-            assert expected_text in result.text
+            try:
+                fast_wait(
+                    self.browser, Config.ELEMENT_TIMEOUT
+                ).until(
+                    lambda driver: driver.execute_script(
+                        "var e = document.querySelector(arguments[0]);"
+                        "return !!(e && e.textContent.includes(arguments[1]));",
+                        _RESULT_NAME[1],
+                        expected_text
+                    )
+                )
+            except TimeoutException:
+                raise AssertionError(
+                    f"Текст '{expected_text}' не найден в результатах поиска"
+                )
         return self
 
     def _verify_english_result(self, expected_result: str):
         """
         Проверяет наличие английского названия в результатах поиска.
 
-        Использует несколько возможных локаторов для поиска альтернативных
-        названий на случай изменения структуры страницы.
+        Все возможные локаторы альтернативного названия объединены в
+        один составной CSS-селектор: одна команда find_elements
+        проверяет их разом, вместо последовательного ожидания каждого
+        локатора (до 3 секунд на каждый промах).
 
         Args:
             expected_result (str): Ожидаемое английское название
@@ -120,23 +145,17 @@ class SearchPage:
         Raises:
             AssertionError: Если английское название не найдено ни в одном
                            из возможных мест
-            TimeoutException: Если ни один из локаторов не сработал
         """
-        possible_locators = [
-            (By.CSS_SELECTOR,
-             "div.search_results > div > div.info > p.alternativeName"),
-            (By.CSS_SELECTOR, "span.alternativeName"),
-            (By.XPATH, "//*[contains(@class, 'alternativeName')]")
-        ]
-
-        for locator in possible_locators:
-            try:
-                element = WebDriverWait(self.browser, 3).until(
-                    EC.presence_of_element_located(locator))
-                if expected_result in element.text:
-                    return
-            except Exception:
-                continue
+        try:
+            elements = fast_wait(self.browser, 3).until(
+                lambda driver: driver.find_elements(*_ALTERNATIVE_NAME)
+            )
+        except Exception:
+            elements = []
+
+        for element in elements:
+            if expected_result in element.text:
+                return
 
         assert expected_result in self.browser.page_source, (
             f"Английское название '{expected_result}' не найдено"
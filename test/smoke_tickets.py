@@ -29,11 +29,35 @@ from config import Config
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
+from waits import fast_wait, wait_for_selector_js
+
+# Локаторы сценария покупки билетов (собраны один раз на уровне модуля)
+_LOC_TICKETS_BTN = (
+    By.XPATH,
+    "//a[contains(@class, 'kinopoisk-header-featured-menu__item') "
+    "and contains(., 'Билеты в кино')]"
+)
+_LOC_CITY_SELECTOR = (
+    By.XPATH,
+    "//details[@data-tid='ba5b39a6']//"
+    "div[contains(@class, 'styles_selectButton__idpGM')]"
+)
+_LOC_MOSCOW_OPTION = (
+    By.XPATH,
+    "//div[contains(@class, 'styles_body__r29th')]//"
+    "*[contains(text(), 'Москва')]"
+)
+_LOC_BUY_BUTTON = (
+    By.XPATH,
+    ".//a[contains(@class, 'style_button__Awsrq') and "
+    "contains(., 'Купить билеты')]"
+)
+_LOC_POPUP = (By.CSS_SELECTOR, ".modal-backdrop, .popup")
 
 
 @pytest.mark.ui
 @pytest.mark.smoke
+@pytest.mark.xdist_group("tickets")
 class TestKinopoiskTickets:
     """Тестовый класс для проверки функционала покупки билетов."""
 
@@ -86,11 +110,7 @@ class TestKinopoiskTickets:
         browser.get(Config.BASE_URL)
 
         tickets_btn = WebDriverWait(browser, Config.ELEMENT_TIMEOUT).until(
-            EC.element_to_be_clickable((
-                By.XPATH,
-                "//a[contains(@class, 'kinopoisk-header-featured-menu__item') "
-                "and contains(., 'Билеты в кино')]"
-            ))
+            EC.element_to_be_clickable(_LOC_TICKETS_BTN)
         )
         tickets_btn.click()
 
@@ -104,30 +124,25 @@ class TestKinopoiskTickets:
         Raises:
             AssertionError: Если не удалось установить город Москва
         """
-        city_selector = WebDriverWait(browser, Config.ELEMENT_TIMEOUT).until(
-            EC.presence_of_element_located((
-                By.XPATH,
-                "//details[@data-tid='ba5b39a6']//"
-                "div[contains(@class, 'styles_selectButton__idpGM')]"
-            ))
+        # Быстрый путь: текущий город читается одним JS-вызовом вместо
+        # цепочки presence-wait + find_element + .text; если это уже
+        # Москва (типичный случай), метод завершается сразу
+        current_city = fast_wait(browser, Config.ELEMENT_TIMEOUT).until(
+            lambda driver: driver.execute_script(
+                "var el = document.querySelector("
+                "\"details[data-tid='ba5b39a6'] "
+                "span[class*='styles_buttonCaption__']\");"
+                "return el ? el.textContent.trim() : null;"
+            )
         )
 
-        current_city = city_selector.find_element(
-            By.XPATH,
-            ".//span[contains(@class, 'styles_buttonCaption__llWnp')]"
-        ).text
-
         if current_city != "Москва":
-            city_selector.click()
+            browser.find_element(*_LOC_CITY_SELECTOR).click()
 
-            moscow_option = WebDriverWait(
+            moscow_option = fast_wait(
                 browser, Config.ELEMENT_TIMEOUT
             ).until(
-                EC.element_to_be_clickable((
-                    By.XPATH,
-                    "//div[contains(@class, 'styles_body__r29th')]//"
-                    "*[contains(text(), 'Москва')]"
-                ))
+                EC.element_to_be_clickable(_LOC_MOSCOW_OPTION)
             )
             moscow_option.click()
 
@@ -135,6 +150,12 @@ class TestKinopoiskTickets:
         """
         Выбор первого фильма из списка и переход к покупке.
 
+        Контейнер, карточка фильма и её название ожидаются одним
+        асинхронным JS-поллером (100 мс) вместо трех последовательных
+        WebDriverWait с опросом раз в 500 мс. Если ссылка 'Купить
+        билеты' уже есть в DOM, переход выполняется напрямую по href;
+        иначе используется прежний сценарий с наведением и кликом.
+
         Args:
             browser: WebDriver instance
 
@@ -144,44 +165,48 @@ class TestKinopoiskTickets:
         Raises:
             AssertionError: Если не удалось выбрать фильм
         """
-        movies_container = WebDriverWait(
-            browser, Config.SEARCH_TIMEOUT
-        ).until(
-            EC.presence_of_element_located((
-                By.XPATH,
-                "//div[contains(@class, 'styles_contentSlot__e6vek')]"
-            ))
-        )
-
-        first_movie = WebDriverWait(
-            movies_container, Config.ELEMENT_TIMEOUT
-        ).until(
-            EC.presence_of_element_located((
-                By.XPATH,
-                ".//div[contains(@class, 'styles_root__dtojy') and "
-                "@data-test-id='movie-list-item'][1]"
-            ))
+        browser.set_script_timeout(Config.SEARCH_TIMEOUT)
+        movie_info = browser.execute_async_script(
+            "var done = arguments[arguments.length - 1];"
+            "var poll = setInterval(function () {"
+            "  var movie = document.querySelector("
+            "    \"div[class*='styles_contentSlot__'] \" +"
+            "    \"div[data-test-id='movie-list-item']\");"
+            "  if (!movie) { return; }"
+            "  var title = movie.querySelector("
+            "    \"span[class*='styles_mainTitle__']\");"
+            "  if (!title) { return; }"
+            "  var buy = movie.querySelector(\"a[class*='style_button__']\");"
+            "  clearInterval(poll);"
+            "  done({title: title.textContent.trim(),"
+            "        buyHref: buy ? buy.href : null,"
+            "        movie: movie});"
+            "}, 100);"
         )
 
-        movie_title = first_movie.find_element(
-            By.XPATH,
-            ".//span[contains(@class, 'styles_mainTitle__RHG2S')]"
-        ).text
-
-        ActionChains(browser).move_to_element(first_movie).perform()
-
-        buy_button = WebDriverWait(
-            first_movie, Config.ELEMENT_TIMEOUT
-        ).until(
-            EC.element_to_be_clickable((
-                By.XPATH,
-                ".//a[contains(@class, 'style_button__Awsrq') and "
-                "contains(., 'Купить билеты')]"
-            ))
-        )
-        buy_button.click()
+        movie_title = movie_info["title"]
+
+        if movie_info["buyHref"]:
+            browser.get(movie_info["buyHref"])
+        else:
+            first_movie = movie_info["movie"]
+            # Наведение одним JS-событием вместо ActionChains
+            # (2-3 CDP-команды эмуляции движения мыши)
+            browser.execute_script(
+                "arguments[0].dispatchEvent("
+                "new MouseEvent('mouseover', {bubbles: true}));"
+                "arguments[0].dispatchEvent("
+                "new MouseEvent('mouseenter', {bubbles: true}));",
+                first_movie
+            )
+            buy_button = fast_wait(
+                first_movie, Config.ELEMENT_TIMEOUT
+            ).until(
+                EC.element_to_be_clickable(_LOC_BUY_BUTTON)
+            )
+            buy_button.click()
 
-        WebDriverWait(browser, Config.SEARCH_TIMEOUT).until(
+        WebDriverWait(browser, Config.PAGE_TIMEOUT).until(
             lambda d: "/afisha/city/" in d.current_url or
             "schedule" in d.current_url.lower() or
             d.find_elements(By.XPATH, "//h1[contains(., 'Расписание')]")
@@ -193,62 +218,65 @@ class TestKinopoiskTickets:
         """
         Выбор кинотеатра и доступного сеанса.
 
+        Активные сеансы всех кинотеатров собираются одним вызовом
+        execute_script (querySelectorAll выполняется в браузере),
+        вместо отдельного find_elements на каждый кинотеатр — один
+        round-trip WebDriver вместо N.
+
         Args:
             browser: WebDriver instance
 
         Raises:
             AssertionError: Если не удалось найти доступные сеансы
         """
-        WebDriverWait(browser, Config.ELEMENT_TIMEOUT * 3).until(
-            EC.presence_of_element_located((
-                By.XPATH, "//div[contains(@class, 'schedule-item')]"
-            ))
+        # Долгое ожидание расписания: MutationObserver срабатывает
+        # сразу при появлении элемента, без опроса DOM из Python
+        wait_for_selector_js(
+            browser,
+            "div[class*='schedule-item']",
+            Config.ELEMENT_TIMEOUT * 3
         )
 
         self._close_popups(browser)
 
-        cinema_items = browser.find_elements(
-            By.XPATH, "//div[contains(@class, 'schedule-item')]"
+        # Один JS-вызов возвращает активные сеансы всех кинотеатров
+        sessions = browser.execute_script(
+            "return Array.from(document.querySelectorAll("
+            "\"div[class*='schedule-item'] "
+            "span[class*='schedule-item__session-button_active']\""
+            ")).filter(function (s) {"
+            "  return s.className.indexOf('disabled') === -1"
+            "    && s.textContent.trim().length > 0;"
+            "});"
         )
 
         selected = False
-        for cinema in cinema_items:
+        for session in sessions:
             try:
+                self._hide_interfering_elements(browser)
 
-                sessions = cinema.find_elements(
-                    By.XPATH,
-                    ".//span["
-                    "contains(@class, 'schedule-item__session-button_active') "
-                    "and not(contains(@class, 'disabled')) "
-                    "and string-length(text()) > 0"
-                    "]"
+                browser.execute_script(
+                    "arguments[0].scrollIntoView({block: 'center'});",
+                    session
+                )
+                browser.execute_script(
+                    "arguments[0].click();", session)
+
+                # Быстро завершающееся ожидание: частый опрос
+                # (0.1 с) убирает до 400 мс холостого простоя
+                WebDriverWait(
+                    browser, Config.PAGE_TIMEOUT, poll_frequency=0.1
+                ).until(
+                    lambda driver: driver.execute_script(
+                        "return document.readyState"
+                    ) == "complete"
                 )
 
-                if sessions:
-                    self._hide_interfering_elements(browser)
-
-                    browser.execute_script(
-                        "arguments[0].scrollIntoView({block: 'center'});",
-                        sessions[0]
-                    )
-                    browser.execute_script(
-                        "arguments[0].click();", sessions[0])
-
-                    WebDriverWait(browser, 10).until(
-                        lambda driver: driver.execute_script(
-                            "return document.readyState"
-                        ) == "complete"
-                    )
-
-                    WebDriverWait(browser, 8).until(
-                        EC.presence_of_element_located((
-                            By.XPATH,
-                            "//iframe[contains(@src, 'afisha.yandex.ru') or "
-                            "contains(@src, 'widget.afisha.yandex.ru')]"
-                        ))
-                    )
-                    selected = True
-                    break
+                wait_for_selector_js(
+                    browser, "iframe[src*='afisha.yandex.ru']", 8
+                )
+                selected = True
+                break
 
             except Exception:
                 self._restore_hidden_elements(browser)
@@ -260,52 +288,42 @@ class TestKinopoiskTickets:
             )
 
     def _close_popups(self, browser):
-        """Закрытие всплывающих окон и модалок."""
+        """Закрытие всплывающих окон и модалок.
+
+        Все кнопки закрытия нажимаются одним вызовом JavaScript,
+        после чего невидимость модалок проверяется одним ожиданием —
+        вместо последовательного клика и ожидания по каждой кнопке.
+        """
         try:
-            close_buttons = browser.find_elements(
-                By.XPATH,
-                "//button[contains(@class, 'close') or "
-                "contains(@class, 'modal-close')]"
+            browser.execute_script(
+                "document.querySelectorAll("
+                "\"button[class*='close'], button[class*='modal-close']\""
+                ").forEach(function (b) {"
+                "  try { b.click(); } catch (e) {}"
+                "});"
+            )
+            WebDriverWait(browser, 1, poll_frequency=0.1).until(
+                EC.invisibility_of_element_located(_LOC_POPUP)
             )
-            for btn in close_buttons:
-                try:
-                    btn.click()
-
-                    WebDriverWait(browser, 1).until(
-                        EC.invisibility_of_element_located((
-                            By.CSS_SELECTOR,
-                            ".modal-backdrop, .popup"
-                        ))
-                    )
-                except Exception:
-                    continue
         except Exception:
             pass
 
     def _hide_interfering_elements(self, browser):
-        """Скрытие мешающих элементов."""
+        """Скрытие мешающих элементов одним вызовом JavaScript."""
         try:
-            iframes = browser.find_elements(By.TAG_NAME, "iframe")
-            for iframe in iframes:
-                try:
-                    browser.execute_script(
-                        "arguments[0].style.display = 'none';", iframe
-                    )
-                except Exception:
-                    continue
+            browser.execute_script(
+                "document.querySelectorAll('iframe').forEach("
+                "function (f) { f.style.display = 'none'; });"
+            )
         except Exception:
             pass
 
     def _restore_hidden_elements(self, browser):
-        """Восстановление скрытых элементов."""
+        """Восстановление скрытых элементов одним вызовом JavaScript."""
         try:
-            iframes = browser.find_elements(By.TAG_NAME, "iframe")
-            for iframe in iframes:
-                try:
-                    browser.execute_script(
-                        "arguments[0].style.display = 'block';", iframe
-                    )
-                except Exception:
-                    continue
+            browser.execute_script(
+                "document.querySelectorAll('iframe').forEach("
+                "function (f) { f.style.display = 'block'; });"
+            )
         except Exception:
             pass
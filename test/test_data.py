@@ -11,7 +11,12 @@
 
 2. Проверки эндпоинта получения случайного фильма.
 
-Все тестовые данные содержат:
+Тест-кейсы описываются неизменяемыми namedtuple SearchCase и
+собираются в кортежи: pytest не делает глубокую интроспекцию
+изменяемых словарей при сборе параметризаций, а явные ids берутся
+из поля description.
+
+Каждый тест-кейс содержит:
 - Непосредственно тестовый запрос (query)
 - Четкое описание цели теста (description)
 - Явные ожидания от API (min_results, expect_results и др.)
@@ -19,9 +24,37 @@
 
 Пример использования в тестах:
     >>> test_case = TestData.POSITIVE_SEARCH_QUERIES[0]
-    >>> assert len(search_results) >= test_case["min_results"]
+    >>> assert len(search_results) >= test_case.min_results
 """
 
+import collections
+
+# Неизменяемое описание одного поискового тест-кейса:
+#   query               - строка запроса
+#   description         - пояснение цели теста (используется как id)
+#   min_results         - минимальное ожидаемое кол-во результатов
+#   expect_results      - ожидаем ли вообще результаты
+#   check_text_part     - какая строка должна быть в результатах
+#   check_partial_match - нужно ли проверять частичное совпадение
+#   expected_status     - ожидаемый HTTP-статус ошибки (если есть)
+#   query_factory       - фабрика запроса для крупных/генерируемых
+#                         строк: вызывается самим тестом, чтобы
+#                         данные не жили в памяти со времени сборки
+SearchCase = collections.namedtuple(
+    "SearchCase",
+    (
+        "query",
+        "description",
+        "min_results",
+        "expect_results",
+        "check_text_part",
+        "check_partial_match",
+        "expected_status",
+        "query_factory",
+    ),
+    defaults=(0, False, None, False, None, None),
+)
+
 
 class TestData:
     """Класс для хранения тестовых данных с явными ожиданиями поведения API."""
@@ -32,90 +65,83 @@ class TestData:
     2. NEGATIVE_SEARCH_QUERIES -
     проблемные запросы для проверки обработки ошибок
     3. RANDOM_MOVIE_ENDPOINT - константа для тестирования эндпоинта /random
-
-    Структура каждого тест-кейса:
-    {
-        "query": str,               # Строка запроса
-        "description": str,         # Пояснение цели теста
-        "min_results": int,         # Минимальное ожидаемое кол-во результатов
-        "expect_results": bool,     # Ожидаем ли вообще результаты
-        "check_text_part": str,     # Какая строка должна быть в результатах
-        "check_partial_match": bool # Нужно ли проверять частичное совпадение
-    }
     """
     # Позитивные тесты (ожидаем найденные фильмы)
-    POSITIVE_SEARCH_QUERIES = [
-        {
-            "query": "В списках не значился",
-            "description": "Точное название - проверка точного совпадения",
-            "min_results": 1  # Ожидаем хотя бы 1 результат
-        },
-        {
-            "query": "Novocaine",
-            "description": "Название на английском",
-            "min_results": 1
-        },
-        {
-            "query": "Годзилла 1998",
-            "description": "Название с годом",
-            "min_results": 1
-        },
-        {
-            "query": "Терми",
-            "description": "Частичное название",
-            "min_results": 3  # Ожидаем несколько вариантов
-        }
-    ]
+    POSITIVE_SEARCH_QUERIES = (
+        SearchCase(
+            query="В списках не значился",
+            description="Точное название - проверка точного совпадения",
+            min_results=1,  # Ожидаем хотя бы 1 результат
+        ),
+        SearchCase(
+            query="Novocaine",
+            description="Название на английском",
+            min_results=1,
+        ),
+        SearchCase(
+            query="Годзилла 1998",
+            description="Название с годом",
+            min_results=1,
+        ),
+        SearchCase(
+            query="Терми",
+            description="Частичное название",
+            min_results=3,  # Ожидаем несколько вариантов
+        ),
+    )
 
     # Негативные тесты с явными ожиданиями
-    NEGATIVE_SEARCH_QUERIES = [
+    NEGATIVE_SEARCH_QUERIES = (
         # Спецсимволы
-        {
-            "query": "@#%",
-            "description": "Только спецсимволы",
-            "expect_results": True  # Ожидаем ли результаты для такого запроса
-        },
-        {
-            "query": "@#%Годзилла",
-            "description": "Спецсимволы в начале",
-            "expect_results": True,
-            "check_text_part": "Годзилла"
-        },
-        {
-            "query": "Годзилла@",
-            "description": "Спецсимволы в конце",
-            "expect_results": True,
-            "check_text_part": "Годзилла"
-        },
+        SearchCase(
+            query="@#%",
+            description="Только спецсимволы",
+            expect_results=True,  # Ожидаем ли результаты для запроса
+        ),
+        SearchCase(
+            query="@#%Годзилла",
+            description="Спецсимволы в начале",
+            expect_results=True,
+            check_text_part="Годзилла",
+        ),
+        SearchCase(
+            query="Годзилла@",
+            description="Спецсимволы в конце",
+            expect_results=True,
+            check_text_part="Годзилла",
+        ),
 
         # Unicode
-        {
-            "query": "ó♝▼☥❋",
-            "description": "Юникод-символы",
-            "expect_results": False
-        },
+        SearchCase(
+            query="ó♝▼☥❋",
+            description="Юникод-символы",
+            expect_results=False,
+        ),
 
         # Иероглифы
-        {
-            "query": "龙之剑",
-            "description": "Китайские иероглифы",
-            "check_partial_match": True
-        },
+        SearchCase(
+            query="龙之剑",
+            description="Китайские иероглифы",
+            check_partial_match=True,
+        ),
 
         # Пустой запрос
-        {
-            "query": "",
-            "description": "Пустой запрос - возвращает популярные фильмы",
-            "expect_results": True
-        },
-
-        # Длинный запрос
-        {
-            "query": "a"*256,
-            "description": "Длинный запрос (>255 символов)",
-            "expect_results": False
-        }
-    ]
+        SearchCase(
+            query="",
+            description="Пустой запрос - возвращает популярные фильмы",
+            expect_results=True,
+        ),
+
+        # Длинный запрос: строится фабрикой на время теста, а не
+        # хранится в атрибуте класса с момента импорта. Паттерн для
+        # любых будущих больших/генерируемых данных в TestData
+        SearchCase(
+            query=None,
+            description="Длинный запрос (>255 символов)",
+            expect_results=False,
+            query_factory=lambda: "a" * 256,
+        ),
+    )
 
     # Рандомный фильм
     RANDOM_MOVIE_ENDPOINT = "/random"
@@ -25,12 +25,21 @@
 import pytest
 import allure
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
+from waits import fast_wait
 from selenium.webdriver.support import expected_conditions as EC
 from config import Config
 from search_page import SearchPage
 
 
+# Локаторы уровня модуля: константы не пересобираются на каждый вызов
+_LOC_SEARCH_INPUT = (By.NAME, "kp_query")
+_LOC_FILM_LINK = (
+    By.CSS_SELECTOR,
+    "div.search_results > div > div.info > p.name > a",
+)
+
+
+@pytest.mark.slow
 @pytest.mark.ui
 @pytest.mark.smoke
 class TestKinopoiskSearch:
@@ -46,7 +55,7 @@ class TestKinopoiskSearch:
     - Поиск с опечаткой (проверка исправления опечаток)
 
     Все тесты используют Allure для детальной отчетности и
-    WebDriverWait для стабильности ожиданий элементов.
+    явные ожидания (fast_wait) для стабильности работы с элементами.
     """
 
     @allure.feature("Поиск фильмов")
@@ -83,10 +92,7 @@ class TestKinopoiskSearch:
 
         # Шаг 5: Переход на страницу фильма
         with allure.step("Шаг 5: Переход на страницу фильма"):
-            film_link = browser.find_element(
-                By.CSS_SELECTOR,
-                "div.search_results > div > div.info > p.name > a"
-            )
+            film_link = browser.find_element(*_LOC_FILM_LINK)
             film_link.click()
             assert Config.TEST_DATA["russian_film"] in browser.title
 
@@ -99,14 +105,14 @@ class TestKinopoiskSearch:
         # Шаг 7: Пустой поиск
         with allure.step("Шаг 7: Пустой поиск"):
             browser.get(Config.BASE_URL)
-            search_input = WebDriverWait(
+            search_input = fast_wait(
                 browser, Config.ELEMENT_TIMEOUT
             ).until(
-                EC.presence_of_element_located((By.NAME, "kp_query"))
+                EC.presence_of_element_located(_LOC_SEARCH_INPUT)
             )
             search_input.clear()
             search_input.send_keys("\n")  # Отправка Enter с пустым полем
-            WebDriverWait(browser, Config.ELEMENT_TIMEOUT).until(
+            fast_wait(browser, Config.ELEMENT_TIMEOUT).until(
                 EC.title_contains("Случайный фильм")
             )
             assert "Случайный фильм" in browser.title
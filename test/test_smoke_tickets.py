@@ -1,7 +1,10 @@
 """
 Модуль smoke-тестирования функционала покупки билетов на Кинопоиске.
 
-Содержит end-to-end тест проверки полного цикла покупки билетов.
+Содержит end-to-end сценарий проверки полного цикла покупки билетов,
+разбитый на поэтапные тесты: при падении на позднем шаге pytest --lf
+перезапускает только его, восстанавливая браузер из сохраненного
+состояния (URL + cookies) вместо повторного прохождения всего пути.
 """
 
 import pytest
@@ -10,19 +13,114 @@ from config import Config
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException
+from waits import fast_wait, wait_for_selector_js
 
 
+# Локаторы уровня модуля: CSS-селекторы компилируются нативным
+# движком querySelector браузера и не пересобираются на каждый вызов,
+# в отличие от XPath-выражений с contains(@class, ...)
+_LOC_CITY_SELECTOR = (
+    By.CSS_SELECTOR,
+    "details[data-tid='ba5b39a6'] div[class*='styles_selectButton__']",
+)
+_LOC_MOVIES_CONTAINER = (
+    By.CSS_SELECTOR, "div[class*='styles_contentSlot__']"
+)
+_LOC_FIRST_MOVIE = (
+    By.CSS_SELECTOR,
+    "div[class*='styles_root__'][data-test-id='movie-list-item']",
+)
+_LOC_MOVIE_TITLE = (
+    By.CSS_SELECTOR, "span[class*='styles_mainTitle__']"
+)
+_LOC_CLOSE_BUTTON = (By.CSS_SELECTOR, "button[class*='close']")
+_LOC_POPUP = (By.CSS_SELECTOR, ".modal-backdrop, .popup")
+
+# Текстовые предикаты не выражаются в CSS, поэтому поиск по тексту
+# выполняется одним JS-вызовом: querySelectorAll + textContent вместо
+# XPath contains(.) на стороне медленного XPath-движка
+_FIND_BY_TEXT_JS = (
+    "return Array.from(document.querySelectorAll(arguments[0]))"
+    ".find(function (el) {"
+    "  return el.textContent.indexOf(arguments[1]) !== -1;"
+    "}) || null;"
+)
+
+# То же самое, но поиск внутри переданного элемента
+_FIND_IN_ELEMENT_BY_TEXT_JS = (
+    "return Array.from(arguments[0].querySelectorAll(arguments[1]))"
+    ".find(function (el) {"
+    "  return el.textContent.indexOf(arguments[2]) !== -1;"
+    "}) || null;"
+)
+
+
+def _find_active_sessions(browser):
+    """Возвращает активные сеансы всех кинотеатров одним JS-вызовом.
+
+    Вместо find_elements по каждому кинотеатру (N x M round-trip по
+    wire-протоколу) один execute_script собирает все активные кнопки
+    сеансов через нативный CSS-движок браузера и возвращает их как
+    готовые WebElement.
+    """
+    return browser.execute_script(
+        "return Array.from(document.querySelectorAll("
+        "\"div[class*='schedule-item'] "
+        "span[class*='schedule-item__session-button_active']\""
+        ")).filter(function (s) {"
+        "  return s.className.indexOf('disabled') === -1"
+        "    && s.textContent.trim().length > 0;"
+        "});"
+    )
+
+
+@pytest.mark.slow
 @pytest.mark.smoke
 @pytest.mark.ui
+@pytest.mark.xdist_group("tickets")
 class TestKinopoiskTickets:
-    """Тестовый класс для проверки покупки билетов на Кинопоиске."""
+    """Поэтапный сценарий покупки билетов на Кинопоиске.
+
+    Тесты выполняются в порядке объявления (штатный порядок pytest) и
+    связаны классовой фикстурой ticket_flow_state: каждый шаг
+    сохраняет URL и cookies после успеха, следующий восстанавливает
+    их перед началом. Группа xdist_group('tickets') удерживает всю
+    цепочку на одном воркере при параллельном запуске.
+    """
+
+    @pytest.fixture(scope="class")
+    def ticket_flow_state(self):
+        """Состояние сценария, разделяемое шагами-тестами."""
+        return {"url": None, "cookies": None}
+
+    @staticmethod
+    def _save_state(browser, state):
+        """Запоминает точку сценария после успешного шага."""
+        state["url"] = browser.current_url
+        state["cookies"] = browser.get_cookies()
+
+    @staticmethod
+    def _restore_state(browser, state):
+        """Возвращает браузер в точку, сохраненную предыдущим шагом.
+
+        Если предыдущий шаг не прошел, текущий пропускается — падение
+        одного шага не размножается в каскад заведомо ложных ошибок.
+        """
+        if state["url"] is None:
+            pytest.skip("Предыдущий шаг сценария не пройден")
+        browser.get(state["url"])
+        for cookie in state["cookies"]:
+            try:
+                browser.add_cookie(cookie)
+            except Exception:
+                continue
+        browser.refresh()
 
     @allure.feature("KR-34 / Smoke testing Kinopoisk")
     @allure.story("Подбор и покупка билетов в кино")
-    def test_first_steps(self, browser):
-        """End-to-end тест полного цикла покупки билетов."""
+    def test_open_tickets_section(self, browser, ticket_flow_state):
+        """Шаг 1: переход в раздел 'Билеты в кино'."""
         with allure.step(
             "Step 1: Зайти на сайт Кинопоиск и перейти в раздел Билеты в кино"
         ):
@@ -30,54 +128,69 @@ class TestKinopoiskTickets:
             tickets_btn = WebDriverWait(
                 browser, Config.ELEMENT_TIMEOUT
             ).until(
-                EC.element_to_be_clickable((
-                    By.XPATH,
-                    "//a["
-                    "contains(@class, 'kinopoisk-header-featured-menu__item') "
-                    "and contains(., 'Билеты в кино')"
-                    "]"
-                ))
+                lambda driver: driver.execute_script(
+                    _FIND_BY_TEXT_JS,
+                    "a.kinopoisk-header-featured-menu__item",
+                    "Билеты в кино",
+                )
             )
             tickets_btn.click()
+            WebDriverWait(browser, Config.PAGE_TIMEOUT).until(
+                lambda driver: "afisha" in driver.current_url
+            )
+            self._save_state(browser, ticket_flow_state)
+
+    @allure.feature("KR-34 / Smoke testing Kinopoisk")
+    @allure.story("Подбор и покупка билетов в кино")
+    def test_select_moscow(self, browser, ticket_flow_state):
+        """Шаг 2: проверка/выбор города Москва."""
+        self._restore_state(browser, ticket_flow_state)
+        ticket_flow_state["url"] = None
 
         with allure.step("Step 2: Проверить/выбрать город Москва"):
             try:
-                city_selector = WebDriverWait(
+                # Быстрый путь: текущий город читается одним JS-вызовом
+                # вместо цепочки presence-wait + find_element + .text;
+                # если это уже Москва (типичный случай), шаг завершен
+                # Быстрые пост-кликовые переходы опрашиваются
+                # каждые 0.1 с (см. fast_wait в waits.py)
+                current_city = fast_wait(
                     browser, Config.ELEMENT_TIMEOUT
                 ).until(
-                    EC.presence_of_element_located((
-                        By.XPATH,
-                        "//details[@data-tid='ba5b39a6']//"
-                        "div[contains(@class, 'styles_selectButton__idpGM')]"
-                    ))
+                    lambda driver: driver.execute_script(
+                        "var el = document.querySelector("
+                        "\"details[data-tid='ba5b39a6'] "
+                        "span[class*='styles_buttonCaption__']\");"
+                        "return el ? el.textContent.trim() : null;"
+                    )
                 )
 
-                current_city = city_selector.find_element(
-                    By.XPATH,
-                    ".//span[contains(@class, 'styles_buttonCaption__llWnp')]"
-                ).text
-
                 if current_city != "Москва":
-                    city_selector.click()
-                    moscow_option = WebDriverWait(
+                    browser.find_element(*_LOC_CITY_SELECTOR).click()
+                    moscow_option = fast_wait(
                         browser, Config.ELEMENT_TIMEOUT
                     ).until(
-                        EC.element_to_be_clickable((
-                            By.XPATH,
-                            "//div[contains(@class, 'styles_body__r29th')]//"
-                            "*[contains(text(), 'Москва')]"
-                        ))
+                        lambda driver: driver.execute_script(
+                            _FIND_BY_TEXT_JS,
+                            "div[class*='styles_body__'] *",
+                            "Москва",
+                        )
                     )
                     moscow_option.click()
 
             except Exception:
-                allure.attach(
-                    browser.get_screenshot_as_png(),
-                    name="city_selection_failed",
-                    attachment_type=allure.attachment_type.PNG
-                )
+                # Скриншот падения снимает единый хук в conftest.py
                 raise AssertionError("Не удалось установить город Москва")
 
+        self._save_state(browser, ticket_flow_state)
+
+    @allure.feature("KR-34 / Smoke testing Kinopoisk")
+    @allure.story("Подбор и покупка билетов в кино")
+    def test_pick_first_movie(self, browser, ticket_flow_state):
+        """Шаг 3: выбор первого фильма и переход к покупке билетов."""
+        self._restore_state(browser, ticket_flow_state)
+        ticket_flow_state["url"] = None
+
         with allure.step(
             "Step 3: Выбрать первый фильм из списка и нажать 'Купить билеты'"
         ):
@@ -85,180 +198,154 @@ class TestKinopoiskTickets:
                 movies_container = WebDriverWait(
                     browser, Config.SEARCH_TIMEOUT
                 ).until(
-                    EC.presence_of_element_located((
-                        By.XPATH,
-                        "//div[contains(@class, 'styles_contentSlot__e6vek')]"
-                    ))
+                    EC.presence_of_element_located(_LOC_MOVIES_CONTAINER)
                 )
 
-                first_movie = WebDriverWait(
+                first_movie = fast_wait(
                     movies_container, Config.ELEMENT_TIMEOUT
                 ).until(
-                    EC.presence_of_element_located((
-                        By.XPATH,
-                        ".//div[contains(@class, 'styles_root__dtojy') and "
-                        "@data-test-id='movie-list-item'][1]"
-                    ))
+                    EC.presence_of_element_located(_LOC_FIRST_MOVIE)
                 )
 
-                first_movie.find_element(
-                    By.XPATH,
-                    ".//span[contains(@class, 'styles_mainTitle__RHG2S')]"
-                ).text
+                first_movie.find_element(*_LOC_MOVIE_TITLE).text
 
-                ActionChains(browser).move_to_element(first_movie).perform()
+                # Наведение одним JS-событием вместо ActionChains:
+                # без round-trip в actions API и синтетического
+                # mousemove через CDP
+                browser.execute_script(
+                    "arguments[0].dispatchEvent("
+                    "new MouseEvent('mouseover', {bubbles: true}));"
+                    "arguments[0].dispatchEvent("
+                    "new MouseEvent('mouseenter', {bubbles: true}));",
+                    first_movie
+                )
 
-                buy_button = WebDriverWait(
-                    first_movie, Config.ELEMENT_TIMEOUT
+                buy_button = fast_wait(
+                    browser, Config.ELEMENT_TIMEOUT
                 ).until(
-                    EC.element_to_be_clickable((
-                        By.XPATH,
-                        ".//a[contains(@class, 'style_button__Awsrq') and "
-                        "contains(., 'Купить билеты')]"
-                    ))
+                    lambda driver: driver.execute_script(
+                        _FIND_IN_ELEMENT_BY_TEXT_JS,
+                        first_movie,
+                        "a[class*='style_button__']",
+                        "Купить билеты",
+                    )
                 )
                 buy_button.click()
 
-                WebDriverWait(browser, Config.SEARCH_TIMEOUT).until(
+                WebDriverWait(browser, Config.PAGE_TIMEOUT).until(
                     lambda driver: "/afisha/city/" in driver.current_url or
                     "schedule" in driver.current_url.lower() or
-                    driver.find_elements(
-                        By.XPATH, "//h1[contains(., 'Расписание')]"
-                    )
+                    driver.execute_script(
+                        _FIND_BY_TEXT_JS, "h1", "Расписание"
+                    ) is not None
                 )
 
             except Exception:
-                allure.attach(
-                    browser.get_screenshot_as_png(),
-                    name="film_selection_failed",
-                    attachment_type=allure.attachment_type.PNG
-                )
+                # Скриншот падения снимает единый хук в conftest.py
                 raise AssertionError("Не удалось выбрать первый фильм")
 
+        self._save_state(browser, ticket_flow_state)
+
+    @allure.feature("KR-34 / Smoke testing Kinopoisk")
+    @allure.story("Подбор и покупка билетов в кино")
+    def test_pick_session(self, browser, ticket_flow_state):
+        """Шаг 4: выбор кинотеатра и активного сеанса."""
+        self._restore_state(browser, ticket_flow_state)
+        ticket_flow_state["url"] = None
+
         with allure.step("Step 4: Выбрать кинотеатр и сеанс"):
             try:
-                WebDriverWait(browser, Config.ELEMENT_TIMEOUT * 3).until(
-                    EC.presence_of_element_located((
-                        By.XPATH, "//div[contains(@class, 'schedule-item')]"
-                    ))
+                # Событийное ожидание вместо опроса каждые 0.5 с
+                wait_for_selector_js(
+                    browser,
+                    "div[class*='schedule-item']",
+                    Config.ELEMENT_TIMEOUT * 3
                 )
 
                 try:
                     close_buttons = browser.find_elements(
-                        By.XPATH,
-                        "//button[contains(@class, 'close') or "
-                        "contains(@class, 'modal-close')]"
+                        *_LOC_CLOSE_BUTTON
                     )
                     for button in close_buttons:
                         try:
                             button.click()
                             WebDriverWait(browser, 1).until(
-                                EC.invisibility_of_element_located((
-                                    By.CSS_SELECTOR,
-                                    ".modal-backdrop, .popup"
-                                ))
+                                EC.invisibility_of_element_located(
+                                    _LOC_POPUP
+                                )
                             )
                         except Exception:
                             continue
                 except Exception:
                     pass
 
-                cinema_items = browser.find_elements(
-                    By.XPATH, "//div[contains(@class, 'schedule-item')]"
+                sessions = _find_active_sessions(browser)
+
+                # Одно CSS-правило прячет все мешающие iframe разом:
+                # пересчет стилей выполняет движок браузера, вместо
+                # отдельного execute_script на каждый iframe
+                browser.execute_script(
+                    "if (!document.getElementById('hide-iframes')) {"
+                    "  var s = document.createElement('style');"
+                    "  s.id = 'hide-iframes';"
+                    "  s.textContent = "
+                    "'iframe{display:none!important}';"
+                    "  document.head.appendChild(s);"
+                    "}"
                 )
 
                 selected = False
-                for cinema in cinema_items:
+                for session in sessions:
                     try:
-
-                        sessions = cinema.find_elements(
-                            By.XPATH,
-                            ".//span["
-                            "contains(@class, "
-                            "'schedule-item__session-button_active') "
-                            "and not(contains(@class, 'disabled')) "
-                            "and string-length(text()) > 0"
-                            "]"
+                        browser.execute_script(
+                            "arguments[0].scrollIntoView("
+                            "{block: 'center'});",
+                            session
                         )
 
-                        if sessions:
-                            try:
-                                iframes = browser.find_elements(
-                                    By.TAG_NAME, "iframe"
-                                )
-                                for iframe_element in iframes:
-                                    try:
-
-                                        browser.execute_script(
-                                            "arguments[0].style.display = "
-                                            "'none';",
-                                            iframe_element
-                                        )
-
-                                    except Exception:
-                                        pass
-                            except Exception:
-                                pass
-
-                            browser.execute_script(
-                                "arguments[0].scrollIntoView("
-                                "{block: 'center'});",
-                                sessions[0]
-                            )
+                        browser.execute_script(
+                            "arguments[0].click();", session
+                        )
 
-                            browser.execute_script(
-                                "arguments[0].click();", sessions[0]
-                            )
+                        # Частый опрос (0.05 с) вместо дефолтных
+                        # 0.5 с: до 450 мс меньше холостого простоя
+                        # на каждую попытку выбора сеанса
+                        WebDriverWait(
+                            browser, Config.PAGE_TIMEOUT,
+                            poll_frequency=0.05
+                        ).until(
+                            lambda driver: driver.execute_script(
+                                "return document.readyState"
+                            ) == "complete"
+                        )
 
-                            WebDriverWait(browser, 10).until(
-                                lambda driver: driver.execute_script(
-                                    "return document.readyState"
-                                ) == "complete"
+                        try:
+                            wait_for_selector_js(
+                                browser,
+                                "iframe[src*='afisha.yandex.ru']",
+                                8
                             )
-
-                            try:
-                                WebDriverWait(browser, 8).until(
-                                    EC.presence_of_element_located((
-                                        By.XPATH,
-                                        "//iframe["
-                                        "contains(@src, 'afisha.yandex.ru') "
-                                        "or contains(@src, "
-                                        "'widget.afisha.yandex.ru')"
-                                        "]"
-                                    ))
-                                )
-                                selected = True
-                                break
-                            except TimeoutException:
-                                try:
-                                    iframes = browser.find_elements(
-                                        By.TAG_NAME, "iframe"
-                                    )
-                                    for iframe_element in iframes:
-                                        try:
-                                            browser.execute_script(
-                                                "arguments[0].style.display = "
-                                                "'block';",
-                                                iframe_element
-                                            )
-                                        except Exception:
-                                            pass
-                                except Exception:
-                                    pass
-                                continue
+                            selected = True
+                            break
+                        except TimeoutException:
+                            continue
 
                     except Exception:
                         continue
 
+                # Возвращаем iframe перед переходом к виджету оплаты
+                browser.execute_script(
+                    "var s = document.getElementById('hide-iframes');"
+                    "if (s) { s.remove(); }"
+                )
+
                 if not selected:
                     raise Exception(
                         "Не удалось найти кинотеатр с доступными сеансами"
                     )
 
             except Exception:
-                allure.attach(
-                    browser.get_screenshot_as_png(),
-                    name="session_selection_failed",
-                    attachment_type=allure.attachment_type.PNG
-                )
+                # Скриншот падения снимает единый хук в conftest.py
                 raise AssertionError("Не удалось выбрать сеанс")
+
+        self._save_state(browser, ticket_flow_state)
@@ -9,15 +9,118 @@ UI тесты для функциональности поиска на Кино
 import pytest
 import allure
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
 
 from config import Config
+from waits import fast_wait
 
 
+@pytest.mark.slow
+@pytest.mark.usefixtures("kinopoisk_home")
 class TestKinopoiskSearch:
-    """Класс тестов для функциональности поиска на Кинопоиске."""
+    """Класс тестов для функциональности поиска на Кинопоиске.
+
+    Главная страница загружается один раз на класс фикстурой
+    kinopoisk_home; перед каждым тестом _reset_search возвращает
+    страницу к состоянию нового поиска без полной перезагрузки.
+    """
+
+    # Варианты селекторов результатов поиска: собраны один раз на
+    # уровне класса, комбинированная строка не склеивается заново
+    # при каждой проверке. Основной селектор использует дочерние
+    # комбинаторы (>): движок CSS отсекает несовпадения раньше, чем
+    # на селекторах потомков вроде '.search_results .name', которые
+    # при каждом тике опроса обходят все .name на странице. Из
+    # запасных вариантов оставлены только реально различающиеся
+    # схемы: новая верстка (data-test) и прямой переход на страницу
+    # фильма (h1.name)
+    _RESULT_SELECTORS = (
+        "div.search_results > div > div.info > p.name > a",
+        "[data-test*='film-title']",
+        "h1.name",
+    )
+    _RESULT_SELECTORS_CSS = ", ".join(_RESULT_SELECTORS)
+
+    # Кэш WebElement поля поиска: страница живет весь класс,
+    # поэтому найденная ссылка остается валидной до навигации
+    _search_input = None
+
+    def _get_search_input(self, browser):
+        """
+        Возвращает поле поиска, переиспользуя найденный WebElement.
+
+        Повторный поиск элемента (и ожидание кликабельности) на
+        каждый тест не нужен при живущей весь класс странице;
+        устаревшая после навигации ссылка обнаруживается дешевой
+        пробой и элемент ищется заново.
+
+        Args:
+            browser: Экземпляр WebDriver
+
+        Returns:
+            WebElement: Поле поиска kp_query.
+        """
+        if self._search_input is not None:
+            try:
+                self._search_input.is_enabled()
+                return self._search_input
+            except StaleElementReferenceException:
+                pass
+        # Поле поиска есть на уже загруженной странице почти сразу —
+        # ждать его полный ELEMENT_TIMEOUT нет смысла
+        # presence вместо element_to_be_clickable: поле поиска в
+        # шапке видимо и активно сразу, а проверки is_displayed и
+        # is_enabled стоили два лишних вызова на каждый тик опроса
+        type(self)._search_input = fast_wait(
+            browser,
+            Config.FAST_TIMEOUT,
+            ignored_exceptions=(NoSuchElementException,),
+        ).until(
+            EC.presence_of_element_located((By.NAME, "kp_query"))
+        )
+        return self._search_input
+
+    def _wait(self, browser):
+        """
+        Единое быстрое ожидание для всех тестов класса.
+
+        Опрос каждые 0.1 с вместо дефолтных 0.5 с: средняя задержка
+        обнаружения элемента падает в 5 раз, что на ~30 ожиданиях
+        прогона экономит секунды холостого простоя.
+
+        Args:
+            browser: Экземпляр WebDriver
+
+        Returns:
+            WebDriverWait: Сконфигурированное ожидание.
+        """
+        return fast_wait(
+            browser,
+            Config.ELEMENT_TIMEOUT,
+            ignored_exceptions=(NoSuchElementException,),
+        )
+
+    def _reset_search(self, browser):
+        """
+        Готовит страницу к новому поиску без полной перезагрузки.
+
+        Если поле поиска доступно на текущей странице, достаточно
+        его очистить; полная загрузка главной выполняется только
+        когда тест ушел со страниц с поиском (/chance/ и т.п.).
+
+        Args:
+            browser: Экземпляр WebDriver
+        """
+        inputs = browser.find_elements(By.NAME, "kp_query")
+        if inputs:
+            inputs[0].clear()
+        else:
+            browser.get(Config.BASE_URL)
 
     def search_for_film(self, browser, search_query):
         """
@@ -27,31 +130,46 @@ class TestKinopoiskSearch:
             browser: Экземпляр WebDriver
             search_query: Строка для поиска
         """
-        wait = WebDriverWait(browser, Config.ELEMENT_TIMEOUT)
+        wait = self._wait(browser)
         try:
-            search_input = wait.until(
-                EC.element_to_be_clickable((By.NAME, "kp_query"))
+            search_input = self._get_search_input(browser)
+
+            # Значение выставляется одним JS-вызовом вместо
+            # посимвольного send_keys (round-trip на каждый символ);
+            # события input/change уведомляют слушателей страницы
+            browser.execute_script(
+                "var el = arguments[0];"
+                "el.focus();"
+                "el.value = arguments[1];"
+                "el.dispatchEvent(new Event('input', {bubbles: true}));"
+                "el.dispatchEvent(new Event('change', {bubbles: true}));",
+                search_input,
+                search_query
             )
-            search_input.clear()
-            search_input.send_keys(search_query)
-
-            # Нажимаем Enter для поиска
-            search_input.send_keys("\n")
-
-            # Ожидание появления результатов поиска
-
-            wait.until(EC.presence_of_element_located((
-                By.CSS_SELECTOR,
-                ".search_results, .block_left, [data-test*='search-results']"
-            )))
 
-            # Дополнительная задержка
-            # Неявное ожидание загрузки элементов
-            wait.until(
-                EC.presence_of_all_elements_located((
+            # Отправка формы одной командой вместо Enter через send_keys
+            search_input.submit()
+
+            # Одно ожидание по конечной цели: если названия
+            # результатов уже в DOM, их контейнер тем более есть —
+            # отдельное ожидание контейнера только удваивало задержку.
+            # presence_of_element_located достаточно: нужен сам факт
+            # появления результатов, а find_element останавливается
+            # на первом совпадении и не сериализует весь список
+            # элементов на каждый тик опроса. any_of параллельно
+            # проверяет второй исход — точный запрос может сразу
+            # перенаправить на страницу фильма (h1.name) — вместо
+            # последовательного ожидания каждого варианта
+            wait.until(EC.any_of(
+                EC.presence_of_element_located((
                     By.CSS_SELECTOR,
-                    ".search_results .name, .block_left .name"
-                )))
+                    "div.search_results > div > div.info > p.name > a, "
+                    "[data-test*='film-title']"
+                )),
+                EC.presence_of_element_located((
+                    By.CSS_SELECTOR, "h1.name"
+                )),
+            ))
 
         except TimeoutException:
             pytest.fail(
@@ -71,44 +189,42 @@ class TestKinopoiskSearch:
         Returns:
             bool: True если найден, False если нет
         """
-        wait = WebDriverWait(browser, Config.ELEMENT_TIMEOUT)
         try:
-            # Поиск всех результатов с разными селекторами
-            selectors = [
-                "div.search_results > div > div.info > p.name > a",
-                ".search_results .name",
-                ".block_left .name",
-                "[data-test*='film-title']",
-                "h1.name",
-                ".film-name"
-            ]
-
-            for selector in selectors:
-                try:
-                    results = wait.until(
-                        EC.presence_of_all_elements_located(
-                            (By.CSS_SELECTOR, selector))
-                    )
-                    if results and len(results) > position:
-                        actual_title = results[position].text.strip()
-                        if partial_match:
-                            # Частичное совпадение
-                            expected_lower = expected_title.lower()
-                            actual_lower = actual_title.lower()
-                            return expected_lower in actual_lower
-
-                        else:
-                            # Точное совпадение
-                            expected_normalized = expected_title.lower()
-                            actual_normalized = actual_title.lower()
-                            return expected_normalized == actual_normalized
-
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            # Один комбинированный CSS-запрос без ожидания:
+            # find_elements возвращает [] вместо исключения, поэтому
+            # отсутствие результатов не порождает TimeoutException
+            # как механизм ветвления (search_for_film уже дождался
+            # появления результатов)
+            results = browser.find_elements(
+                By.CSS_SELECTOR, self._RESULT_SELECTORS_CSS
+            )
+
+            # textContent одним JS-вызовом вместо .text по каждому
+            # элементу: .text заставляет браузер пересчитывать layout
+            # и видимость, плюс round-trip на элемент; недогруженные
+            # узлы с пустым текстом не считаются результатами, иначе
+            # position указывал бы на пустышку
+            texts = browser.execute_script(
+                "return arguments[0].map("
+                "function (e) { return e.textContent.trim(); });",
+                results
+            )
+            titles = [t for t in texts if t]
+            if len(titles) > position:
+                # casefold вместо lower: корректное сведение регистра
+                # для кириллицы (ё/Ё и подобные случаи)
+                actual_title = titles[position].casefold()
+                expected = expected_title.casefold()
+                if partial_match:
+                    # Частичное совпадение
+                    return expected in actual_title
+                # Точное совпадение
+                return expected == actual_title
 
             return False
 
-        except Exception:
+        except StaleElementReferenceException:
+            # Страница перерисовалась между запросом и чтением текста
             return False
 
     @pytest.mark.ui
@@ -116,7 +232,7 @@ class TestKinopoiskSearch:
     @allure.story("Точное совпадение названия")
     def test_fpk1_exact_match_search(self, browser):
         """FPK 1: Точное совпадение названия."""
-        browser.get(Config.BASE_URL)
+        self._reset_search(browser)
 
         search_query = "В списках не значился"
         self.search_for_film(browser, search_query)
@@ -129,7 +245,7 @@ class TestKinopoiskSearch:
     @allure.story("Поиск на русском языке")
     def test_fpk2_russian_search(self, browser):
         """FPK 2: Поиск на русском языке."""
-        browser.get(Config.BASE_URL)
+        self._reset_search(browser)
 
         search_query = Config.get_test_data("russian_film")
         self.search_for_film(browser, search_query)
@@ -142,7 +258,7 @@ class TestKinopoiskSearch:
     @allure.story("Поиск на английском языке")
     def test_fpk3_english_search(self, browser):
         """FPK 3: Поиск на английском языке."""
-        browser.get(Config.BASE_URL)
+        self._reset_search(browser)
 
         english_query = Config.get_test_data("english_film")
         russian_expected = Config.get_test_data("russian_film")
@@ -158,57 +274,45 @@ class TestKinopoiskSearch:
     @allure.story("Частичное совпадение названия")
     def test_fpk4_partial_match(self, browser):
         """FPK 4: Частичное совпадение названия."""
-        browser.get(Config.BASE_URL)
+        self._reset_search(browser)
 
         search_query = "Три"
 
         self.search_for_film(browser, search_query)
 
-        # Проверяем, что в результатах поиска есть названия, содержащие "Три"
-        wait = WebDriverWait(browser, Config.ELEMENT_TIMEOUT)
-        try:
-            # Получаем все результаты поиска
-            results = wait.until(
-                EC.presence_of_all_elements_located((
-                    By.CSS_SELECTOR,
-                    ".search_results .name, .block_left .name, "
-                    "[data-test*='film-title']"
-                ))
-            )
-
-            # Проверяем, что есть хотя бы несколько результатов
-            assert len(results) > 0, "Нет результатов поиска"
-
-            # Считаем сколько результатов содержат "Три"
-            results_with_tri = 0
-            tri_results = []
-
-            for result in results:
-                result_text = result.text.strip()
-                if 'три' in result_text.lower():  # Проверяем в нижнем регистре
-                    results_with_tri += 1
-                    tri_results.append(result_text)
+        # search_for_film уже дождался появления результатов —
+        # повторное ожидание здесь лишь добавляло холостой цикл
+        # опроса (и второй полный таймаут при падении)
+
+        # Все названия одним JS-вызовом: каждый доступ к .text —
+        # отдельный round-trip WebDriver, для N результатов это
+        # N сетевых запросов вместо одного
+        titles = browser.execute_script(
+            "return Array.from(document.querySelectorAll("
+            "'div.search_results > div > div.info > p.name > a, "
+            "[data-test*=\"film-title\"]'"
+            ")).map(function (e) { return e.textContent.trim(); });"
+        )
 
-            print(f"Найдено результатов с 'Три': {results_with_tri}")
-            for i, result in enumerate(tri_results):
-                print(f"Результат с 'Три' {i}: '{result}'")
+        # Проверяем, что есть хотя бы несколько результатов
+        assert len(titles) > 0, "Нет результатов поиска"
 
-            # Проверяем, что хотя бы 3 результата содержат "Три"
-            assert results_with_tri >= 3, (
-                f"Мало результатов с 'Три'. Найдено: {results_with_tri}, "
-                f"ожидалось минимум 3. Все результаты: "
-                f"{[r.text for r in results[:5]]}"
-            )
+        # Совпадения одним списковым включением; вывод в stdout
+        # убран — при падении найденные названия видны в сообщении
+        matches = [t for t in titles if 'три' in t.casefold()]
 
-        except TimeoutException:
-            pytest.fail("Не удалось получить результаты поиска")
+        # Проверяем, что хотя бы 3 результата содержат "Три"
+        assert len(matches) >= 3, (
+            f"Мало результатов с 'Три'. Найдено: {len(matches)}, "
+            f"ожидалось минимум 3. Все результаты: {titles[:5]}"
+        )
 
     @pytest.mark.ui
     @allure.feature("Поиск фильмов")
     @allure.story("Поиск с указанием года")
     def test_fpk5_search_with_year(self, browser):
         """FPK 5: Поиск с указанием года."""
-        browser.get(Config.BASE_URL)
+        self._reset_search(browser)
 
         search_query = "Годзилла 1998"
         expected_film = "Годзилла"
@@ -227,7 +331,7 @@ class TestKinopoiskSearch:
     @allure.story("Поиск сериалов")
     def test_fpk6_series_search(self, browser):
         """FPK 6: Поиск сериалов."""
-        browser.get(Config.BASE_URL)
+        self._reset_search(browser)
 
         search_query = "Звездный путь"
         expected_series = "Звездный путь"
@@ -242,7 +346,7 @@ class TestKinopoiskSearch:
     @allure.story("Поиск с учетом регистра")
     def test_fpk7_case_insensitive_search(self, browser):
         """FPK 7: Поиск с учетом регистра."""
-        browser.get(Config.BASE_URL)
+        self._reset_search(browser)
 
         search_query = "сТаЛкер"
         expected_film = "Сталкер"
@@ -258,18 +362,21 @@ class TestKinopoiskSearch:
     @allure.story("Работа автоподсказок")
     def test_fpk8_autosuggestions(self, browser):
         """FPK 8: Работа автоподсказок."""
-        browser.get(Config.BASE_URL)
-        wait = WebDriverWait(browser, Config.ELEMENT_TIMEOUT)
+        self._reset_search(browser)
+        wait = self._wait(browser)
 
         try:
-            search_input = wait.until(
-                EC.element_to_be_clickable((By.NAME, "kp_query"))
-            )
+            search_input = self._get_search_input(browser)
             search_input.clear()
+            # Здесь send_keys оставлен намеренно: автоподсказки
+            # срабатывают на реальные нажатия клавиш, JS-подстановка
+            # значения их не вызывает
             search_input.send_keys("Т")
 
-            # Ожидание появления автоподсказок
-            suggestions = wait.until(
+            # Ожидание появления автоподсказок: подсказки либо
+            # приходят за доли секунды, либо не придут вовсе —
+            # короткий таймаут быстрее заваливает сломанный сценарий
+            suggestions = fast_wait(browser, Config.FAST_TIMEOUT).until(
                 EC.presence_of_element_located((
                     By.CSS_SELECTOR,
                     ".kinopoisk-header-suggest__groups-container, "
@@ -278,21 +385,23 @@ class TestKinopoiskSearch:
                 ))
             )
 
-            # Проверяем, что подсказки начинаются на букву "Т"
-            suggestion_items = suggestions.find_elements(
-                By.CSS_SELECTOR,
-                ".kinopoisk-header-suggest-item__title, .suggestion-item, "
-                "li, [data-test*='suggest-item']"
+            # Тексты всех подсказок одним JS-вызовом: чтение .text
+            # по каждому элементу стоило бы round-trip на подсказку
+            texts = browser.execute_script(
+                "return Array.from(arguments[0].querySelectorAll("
+                "'.kinopoisk-header-suggest-item__title, "
+                ".suggestion-item, li, [data-test*=\"suggest-item\"]'"
+                ")).map(function (e) { return e.textContent.trim(); })"
+                ".filter(Boolean);",
+                suggestions
             )
 
-            assert len(suggestion_items) > 0, "Автоподсказки не появились"
+            assert len(texts) > 0, "Автоподсказки не появились"
 
             # Проверяем, что ВСЕ подсказки начинаются на "Т" (кириллическую)
-            for item in suggestion_items:
-                item_text = item.text.strip()
-                if item_text:  # Проверяем только непустые элементы
-                    assert item_text.lower().startswith('т'), \
-                        f"Подсказка '{item_text}' не начинается на букву 'Т'"
+            for item_text in texts:
+                assert item_text.casefold().startswith('т'), \
+                    f"Подсказка '{item_text}' не начинается на букву 'Т'"
 
         except TimeoutException:
             pytest.fail("Автоподсказки не появились в течение таймаута")
@@ -302,7 +411,7 @@ class TestKinopoiskSearch:
     @allure.story("Поддержка специальных знаков")
     def test_fpk9_special_characters(self, browser):
         """FPK 9: Поддержка специальных знаков."""
-        browser.get(Config.BASE_URL)
+        self._reset_search(browser)
 
         search_query = "Человек-Паук"
         expected_film = "Человек-паук"
@@ -318,18 +427,16 @@ class TestKinopoiskSearch:
     @allure.story("Пустой запрос")
     def test_fpk10_empty_search(self, browser):
         """FPK 10: Пустой запрос."""
-        browser.get(Config.BASE_URL)
-        wait = WebDriverWait(browser, Config.ELEMENT_TIMEOUT)
+        self._reset_search(browser)
+        wait = self._wait(browser)
 
         try:
             # Находим поле поиска и оставляем пустым
-            search_input = wait.until(
-                EC.element_to_be_clickable((By.NAME, "kp_query"))
-            )
+            search_input = self._get_search_input(browser)
             search_input.clear()
 
-            # Нажимаем Enter в пустом поле
-            search_input.send_keys("\n")
+            # Отправляем пустую форму одной командой
+            search_input.submit()
 
             # Ожидаем перехода на страницу /chance/
             wait.until(
@@ -0,0 +1,93 @@
+"""
+Вспомогательный модуль ожиданий для UI-тестов.
+
+Содержит событийное ожидание появления элементов: вместо опроса DOM
+командой find_element каждые 0.5 секунды (round-trip WebDriver на
+каждую попытку) используется MutationObserver внутри браузера —
+одна команда WebDriver на всё ожидание, срабатывающая сразу при
+появлении элемента.
+
+Также предоставляет fast_wait — WebDriverWait с опросом каждые 0.1 с
+для быстрых DOM-переходов после кликов, где дефолтные 0.5 с дают до
+400 мс холостого простоя на каждое ожидание.
+"""
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Асинхронный скрипт: отвечает найденным элементом сразу, подписка
+# через MutationObserver, отсечка по таймауту отвечает null
+_WAIT_FOR_SELECTOR_JS = (
+    "var css = arguments[0];"
+    "var timeoutMs = arguments[1] * 1000;"
+    "var done = arguments[arguments.length - 1];"
+    "var existing = document.querySelector(css);"
+    "if (existing) { done(existing); return; }"
+    "var observer = new MutationObserver(function () {"
+    "  var el = document.querySelector(css);"
+    "  if (el) {"
+    "    clearTimeout(timer);"
+    "    observer.disconnect();"
+    "    done(el);"
+    "  }"
+    "});"
+    "var timer = setTimeout(function () {"
+    "  observer.disconnect();"
+    "  done(null);"
+    "}, timeoutMs);"
+    "observer.observe(document.documentElement,"
+    "  {childList: true, subtree: true});"
+)
+
+
+def wait_for_selector_js(driver, css_selector: str, timeout: int):
+    """Ждет появления элемента по CSS-селектору через MutationObserver.
+
+    Args:
+        driver: WebDriver instance
+        css_selector: CSS-селектор ожидаемого элемента
+        timeout: Максимальное время ожидания (в секундах)
+
+    Returns:
+        WebElement: Найденный элемент.
+
+    Raises:
+        TimeoutException: Если элемент не появился за timeout секунд.
+    """
+    driver.set_script_timeout(timeout + 1)
+    element = driver.execute_async_script(
+        _WAIT_FOR_SELECTOR_JS, css_selector, timeout
+    )
+    if element is None:
+        raise TimeoutException(
+            f"Элемент '{css_selector}' не появился за {timeout} с"
+        )
+    return element
+
+
+def fast_wait(
+    driver,
+    timeout: int,
+    ignored_exceptions: tuple = None
+) -> WebDriverWait:
+    """WebDriverWait с частым опросом для быстрых DOM-переходов.
+
+    Подходит для элементов, появляющихся за 50-200 мс после клика;
+    долгие сетевые ожидания (page load, SEARCH_TIMEOUT) лучше
+    оставлять на дефолтных 0.5 с, чтобы не плодить round-trip.
+
+    Args:
+        driver: WebDriver instance
+        timeout: Максимальное время ожидания (в секундах)
+        ignored_exceptions: Исключения, не прерывающие цикл опроса
+            (по умолчанию, как у WebDriverWait, NoSuchElementException)
+
+    Returns:
+        WebDriverWait: Ожидание с poll_frequency=0.1.
+    """
+    return WebDriverWait(
+        driver,
+        timeout,
+        poll_frequency=0.1,
+        ignored_exceptions=ignored_exceptions,
+    )